@@ -0,0 +1,307 @@
+# cython: language_level=3
+# Copyright European Organization for Nuclear Research (CERN) since 2012
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Optional Cython build of the DID type from rucio.common.didtype.
+
+This module must stay behaviourally identical to the pure-Python class;
+rucio.common.didtype imports it when the compiled extension is available
+and silently falls back otherwise.
+"""
+
+from rucio.common.exception import DIDError
+
+SCOPE_SEPARATOR = ':'
+IMPLICIT_SCOPE_SEPARATOR = '.'
+IMPLICIT_SCOPE_TO_LEN = {'user': 2, 'group': 2}
+_IMPLICIT_SCOPE_MAX_LEN = max(IMPLICIT_SCOPE_TO_LEN.values())
+_IMPLICIT_SCOPE_PREFIXES = tuple(k + '.' for k in IMPLICIT_SCOPE_TO_LEN)
+
+
+cdef class DID:
+
+    """
+    Class used to store a DID
+    Given an object DID of type DID
+    scope is stored in did.scope
+    name is stored in did.name
+    """
+
+    SCOPE_SEPARATOR = SCOPE_SEPARATOR
+    IMPLICIT_SCOPE_SEPARATOR = IMPLICIT_SCOPE_SEPARATOR
+    IMPLICIT_SCOPE_TO_LEN = IMPLICIT_SCOPE_TO_LEN
+
+    # readonly matches the immutability the pure-Python class enforces via
+    # __setattr__, so the memoized _str/_hash can never go stale.
+    cdef readonly str scope
+    cdef readonly str name
+    cdef str _str
+    cdef object _hash
+
+    def __init__(self, *args, **kwargs):
+        """
+        Constructs the DID object. Possible parameter combinations are:
+            DID()
+            DID('scope:name.did.str')
+            DID('user.implicit.scope.in.name')
+            DID('custom.scope', 'custom.name')
+            DID(['list.scope', 'list.name'])
+            DID(('tuple.scope', 'tuple.name'))
+            DID({'scope': 'dict.scope', 'name': 'dict.name'})
+            DID(scope='kw.scope')
+            DID(name='kw.name')
+            DID(name='user.kw.implicit.scope')
+            DID(scope='kw.scope', name='kw.name')
+            DID(did={'scope': 'kw.did.scope', 'name': 'kw.did.name'})
+            DID(did=['kw.list.scope', 'kw.list.name'])
+            DID(did=('kw.tuple.scope', 'kw.tuple.name'))
+            DID('arg.scope', name='kwarg.name')
+            DID('arg.name', scope='kwarg.scope')
+        """
+        self.scope = ''
+        self.name = ''
+        self._str = None
+        self._hash = None
+
+        # Fast paths for the two most common construction shapes,
+        # DID(scope=..., name=...) and DID('scope:name'), which skip the
+        # generic argument parser and its intermediate allocations.
+        if not args:
+            if kwargs.keys() <= {'scope', 'name'}:
+                self.scope = kwargs.get('scope', '')
+                name = kwargs.get('name', '')
+                if name.endswith('/'):
+                    name = name[:-1]
+                self.name = name
+                if not self.scope:
+                    self._update_implicit_scope()
+                if SCOPE_SEPARATOR in self.scope or SCOPE_SEPARATOR in self.name:
+                    raise DIDError('Object has invalid format after construction: {}'.format(str(self)))
+                return
+        elif len(args) == 1 and not kwargs and type(args[0]) is str:
+            self._did_from_str(args[0])
+            if self.name.endswith('/'):
+                self.name = self.name[:-1]
+            if SCOPE_SEPARATOR in self.scope or SCOPE_SEPARATOR in self.name:
+                raise DIDError('Object has invalid format after construction: {}'.format(str(self)))
+            return
+
+        did = self._parse_did_from_args(*args, **kwargs)
+
+        self._construct_did(did)
+
+        if not self.is_valid_format():
+            raise DIDError('Object has invalid format after construction: {}'.format(str(self)))
+
+    def _parse_did_from_args(self, *args, **kwargs):
+        """
+        Parse the DID object from the given arguments
+        :return: DID object
+        """
+        num_args = len(args)
+        num_kwargs = len(kwargs)
+        if (num_args + num_kwargs) > 2:
+            raise DIDError('Constructor takes at most 2 arguments. Given number: {}'.format(num_args + num_kwargs))
+
+        did = ''
+        if num_args == 1:
+            did = args[0]
+
+            if num_kwargs == 1:
+                if isinstance(did, str):
+                    k, v = next(iter(kwargs.items()))
+                    if k == 'scope':
+                        did = (v, did)
+                    elif k == 'name':
+                        did = (did, v)
+                    else:
+                        raise DIDError('Constructor got unexpected keyword argument: {}'.format(k))
+                else:
+                    raise DIDError('First argument of constructor is expected to be string type '
+                                   'when keyword argument is given. Given type: {}'.format(type(did)))
+        elif num_args == 0:
+            did = kwargs.get('did', kwargs)
+        else:
+            did = args
+        return did
+
+    cdef _construct_did(self, did):
+        """
+        Construct the DID object from the given input.
+
+        :param did: input to construct the DID object from
+        """
+        t = type(did)
+        if t is dict:
+            self._did_from_dict(did)
+        elif t is tuple or t is list:
+            self._did_from_list_or_tuple(did)
+        elif t is str:
+            self._did_from_str(did)
+        elif t is DID:
+            self._did_from_did_object(did)
+        elif isinstance(did, dict):
+            self._did_from_dict(did)
+        elif isinstance(did, (tuple, list)):
+            self._did_from_list_or_tuple(did)
+        elif isinstance(did, str):
+            self._did_from_str(did)
+        elif isinstance(did, DID):
+            self._did_from_did_object(did)
+        else:
+            raise DIDError('Cannot build object from: {}'.format(type(did)))
+
+        if self.name.endswith('/'):
+            self.name = self.name[:-1]
+
+    cdef _did_from_str(self, str did):
+        """
+        Construct the DID from a string.
+        :param did: string containing the DID information
+        """
+        head, sep, tail = did.partition(SCOPE_SEPARATOR)
+        if sep:
+            self.scope = head
+            self.name = tail
+        else:
+            self.name = did
+            self._update_implicit_scope()
+            if not self.has_scope():
+                raise DIDError('Object construction from non-splitable string is ambigious')
+
+    cdef _did_from_dict(self, dict did):
+        """
+        Construct the DID from a dictionary.
+        :param did: dictionary optionally containing the keys 'scope' and 'name'
+        """
+        self.scope = did.get('scope', '')
+        self.name = did.get('name', '')
+        if not self.has_scope():
+            self._update_implicit_scope()
+
+    cdef _did_from_list_or_tuple(self, did):
+        """
+        Construct the DID from a list or tuple.
+        :param did: list or tuple with expected length of 2
+        """
+        if len(did) != 2:
+            raise DIDError('Construction from tuple or list requires exactly 2 elements. Number of elements passed: %i' % len(did))
+        self.scope = did[0]
+        self.name = did[1]
+
+    cdef _did_from_did_object(self, DID did):
+        """
+        Construct the DID from another DID object.
+        :param did: DID object
+        """
+        self.scope = did.scope
+        self.name = did.name
+
+    cdef _update_implicit_scope(self):
+        """
+        This method sets the scope if it is implicitly given in self.name
+        """
+        # Check the known prefixes before splitting; only the leading scope
+        # parts are needed, so do not split the whole name.
+        name = self.name
+        if name.startswith(_IMPLICIT_SCOPE_PREFIXES):
+            did_parts = name.split(IMPLICIT_SCOPE_SEPARATOR, _IMPLICIT_SCOPE_MAX_LEN)
+            num_scope_parts = IMPLICIT_SCOPE_TO_LEN[did_parts[0]]
+            self.scope = IMPLICIT_SCOPE_SEPARATOR.join(did_parts[0:num_scope_parts])
+
+    cpdef bint is_valid_format(self):
+        """
+        Method to check if the stored DID has a valid format
+        :return: bool
+        """
+        if SCOPE_SEPARATOR in self.scope or SCOPE_SEPARATOR in self.name:
+            return False
+        return True
+
+    cpdef bint has_scope(self):
+        """
+        Method to check if the scope part was set
+        :return: bool
+        """
+        return len(self.scope) > 0
+
+    cpdef bint has_name(self):
+        """
+        Method to check if the name part was set
+        :return: bool
+        """
+        return len(self.name) > 0
+
+    def __str__(self):
+        """
+        Creates the string representation of self
+        :return: string
+        """
+        s = self._str
+        if s is None:
+            if self.scope and self.name:
+                s = self.scope + SCOPE_SEPARATOR + self.name
+            else:
+                s = self.scope or self.name
+            self._str = s
+        return s
+
+    def __eq__(self, other):
+        """
+        Equality comparison with another object
+        :return: bool
+        """
+        if other is self:
+            return True
+        t = type(other)
+        if t is DID:
+            return self.scope == (<DID>other).scope and self.name == (<DID>other).name
+        if t is str:
+            head, sep, tail = other.partition(SCOPE_SEPARATOR)
+            if sep:
+                return self.scope == head and self.name == tail
+            return str(self) == other
+        try:
+            other = DID(other)
+        except DIDError:
+            return NotImplemented
+        return self.scope == (<DID>other).scope and self.name == (<DID>other).name
+
+    def __reduce__(self):
+        """
+        Supports pickling without going through attribute assignment
+        :return: tuple of the class and the constructor arguments
+        """
+        return (DID, (self.scope, self.name))
+
+    def __ne__(self, other):
+        """
+        Inequality comparison with another object
+        :return: bool
+        """
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        """
+        Uses the string representation of self to create a hash
+        :return: int
+        """
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(str(self))
+        return h
@@ -33,7 +33,12 @@ class DID:
     SCOPE_SEPARATOR = ':'
     IMPLICIT_SCOPE_SEPARATOR = '.'
     IMPLICIT_SCOPE_TO_LEN = {'user': 2, 'group': 2}
-    __slots__ = ['scope', 'name']
+    _IMPLICIT_SCOPE_MAX_LEN = max(IMPLICIT_SCOPE_TO_LEN.values())
+    _IMPLICIT_SCOPE_PREFIXES = tuple(k + '.' for k in IMPLICIT_SCOPE_TO_LEN)
+    # _str and _hash memoize the string representation and hash; immutability
+    # after construction is enforced by __setattr__, so they can never go
+    # stale.
+    __slots__ = ['scope', 'name', '_str', '_hash']
 
     def __init__(self, *args, **kwargs):
         """
@@ -55,8 +60,33 @@ class DID:
             DID('arg.scope', name='kwarg.name')
             DID('arg.name', scope='kwarg.scope')
         """
-        self.scope: str = ''
-        self.name: str = ''
+        object.__setattr__(self, 'scope', '')
+        object.__setattr__(self, 'name', '')
+        object.__setattr__(self, '_str', None)
+        object.__setattr__(self, '_hash', None)
+
+        # Fast paths for the two most common construction shapes,
+        # DID(scope=..., name=...) and DID('scope:name'), which skip the
+        # generic argument parser and its intermediate allocations.
+        if not args:
+            if kwargs.keys() <= {'scope', 'name'}:
+                object.__setattr__(self, 'scope', kwargs.get('scope', ''))
+                name = kwargs.get('name', '')
+                if name.endswith('/'):
+                    name = name[:-1]
+                object.__setattr__(self, 'name', name)
+                if not self.scope:
+                    self._update_implicit_scope()
+                if DID.SCOPE_SEPARATOR in self.scope or DID.SCOPE_SEPARATOR in self.name:
+                    raise DIDError('Object has invalid format after construction: {}'.format(str(self)))
+                return
+        elif len(args) == 1 and not kwargs and type(args[0]) is str:
+            self._did_from_str(args[0])
+            if self.name.endswith('/'):
+                object.__setattr__(self, 'name', self.name[:-1])
+            if DID.SCOPE_SEPARATOR in self.scope or DID.SCOPE_SEPARATOR in self.name:
+                raise DIDError('Object has invalid format after construction: {}'.format(str(self)))
+            return
 
         did = self._parse_did_from_args(*args, **kwargs)
 
@@ -107,9 +137,12 @@ class DID:
 
         :param did: input to construct the DID object from
         """
-        if isinstance(did, dict):
+        handler = _CONSTRUCT_DISPATCH.get(type(did))
+        if handler is not None:
+            handler(self, did)
+        elif isinstance(did, dict):
             self._did_from_dict(did)
-        elif isinstance(did, tuple) or isinstance(did, list):
+        elif isinstance(did, (tuple, list)):
             self._did_from_list_or_tuple(did)
         elif isinstance(did, str):
             self._did_from_str(did)
@@ -119,30 +152,30 @@ class DID:
             raise DIDError('Cannot build object from: {}'.format(type(did)))
 
         if self.name.endswith('/'):
-            self.name = self.name[:-1]
+            object.__setattr__(self, 'name', self.name[:-1])
 
     def _did_from_str(self, did: str) -> None:
         """
         Construct the DID from a string.
         :param did: string containing the DID information
         """
-        did_parts = did.split(DID.SCOPE_SEPARATOR, 1)
-        if len(did_parts) == 1:
-            self.name = did
+        head, sep, tail = did.partition(DID.SCOPE_SEPARATOR)
+        if sep:
+            object.__setattr__(self, 'scope', head)
+            object.__setattr__(self, 'name', tail)
+        else:
+            object.__setattr__(self, 'name', did)
             self._update_implicit_scope()
             if not self.has_scope():
                 raise DIDError('Object construction from non-splitable string is ambigious')
-        else:
-            self.scope = did_parts[0]
-            self.name = did_parts[1]
 
     def _did_from_dict(self, did: dict[str, str]) -> None:
         """
         Construct the DID from a dictionary.
         :param did: dictionary optionally containing the keys 'scope' and 'name'
         """
-        self.scope = did.get('scope', '')
-        self.name = did.get('name', '')
+        object.__setattr__(self, 'scope', did.get('scope', ''))
+        object.__setattr__(self, 'name', did.get('name', ''))
         if not self.has_scope():
             self._update_implicit_scope()
 
@@ -153,32 +186,35 @@ class DID:
         """
         if len(did) != 2:
             raise DIDError('Construction from tuple or list requires exactly 2 elements. Number of elements passed: %i' % len(did))
-        self.scope = did[0]
-        self.name = did[1]
+        object.__setattr__(self, 'scope', did[0])
+        object.__setattr__(self, 'name', did[1])
 
     def _did_from_did_object(self, did: "DID") -> None:
         """
         Construct the DID from another DID object.
         :param did: DID object
         """
-        self.scope = did.scope
-        self.name = did.name
+        object.__setattr__(self, 'scope', did.scope)
+        object.__setattr__(self, 'name', did.name)
 
     def _update_implicit_scope(self) -> None:
         """
         This method sets the scope if it is implicitly given in self.name
         """
-        did_parts = self.name.split(DID.IMPLICIT_SCOPE_SEPARATOR)
-        num_scope_parts = DID.IMPLICIT_SCOPE_TO_LEN.get(did_parts[0], 0)
-        if num_scope_parts > 0:
-            self.scope = '.'.join(did_parts[0:num_scope_parts])
+        # Check the known prefixes before splitting; only the leading scope
+        # parts are needed, so do not split the whole name.
+        name = self.name
+        if name.startswith(DID._IMPLICIT_SCOPE_PREFIXES):
+            did_parts = name.split(DID.IMPLICIT_SCOPE_SEPARATOR, DID._IMPLICIT_SCOPE_MAX_LEN)
+            num_scope_parts = DID.IMPLICIT_SCOPE_TO_LEN[did_parts[0]]
+            object.__setattr__(self, 'scope', DID.IMPLICIT_SCOPE_SEPARATOR.join(did_parts[0:num_scope_parts]))
 
     def is_valid_format(self) -> bool:
         """
         Method to check if the stored DID has a valid format
         :return: bool
         """
-        if self.scope.count(DID.SCOPE_SEPARATOR) or self.name.count(DID.SCOPE_SEPARATOR):
+        if DID.SCOPE_SEPARATOR in self.scope or DID.SCOPE_SEPARATOR in self.name:
             return False
         return True
 
@@ -201,37 +237,87 @@ class DID:
         Creates the string representation of self
         :return: string
         """
-        if self.has_scope() and self.has_name():
-            return '{}{}{}'.format(self.scope, DID.SCOPE_SEPARATOR, self.name)
-        elif self.has_scope():
-            return self.scope
-        return self.name
+        s = self._str
+        if s is None:
+            if self.scope and self.name:
+                s = self.scope + DID.SCOPE_SEPARATOR + self.name
+            else:
+                s = self.scope or self.name
+            object.__setattr__(self, '_str', s)
+        return s
 
     def __eq__(self, other: Union[str, "DID"]) -> bool:
         """
         Equality comparison with another object
         :return: bool
         """
-        if isinstance(other, str):
+        if other is self:
+            return True
+        t = type(other)
+        if t is DID:
+            return self.scope == other.scope and self.name == other.name
+        if t is str:
+            head, sep, tail = other.partition(DID.SCOPE_SEPARATOR)
+            if sep:
+                return self.scope == head and self.name == tail
             return str(self) == other
-        elif not isinstance(other, DID):
-            try:
-                other = DID(other)
-            except DIDError:
-                return False
-
+        try:
+            other = DID(other)
+        except DIDError:
+            return NotImplemented
         return self.scope == other.scope and self.name == other.name
 
+    def __setattr__(self, attr: str, value: Any) -> None:
+        """
+        Rejects attribute modification; DIDs are immutable after construction
+        :raises: AttributeError
+        """
+        raise AttributeError('DID is immutable')
+
+    def __reduce__(self) -> tuple:
+        """
+        Supports pickling without going through __setattr__
+        :return: tuple of the class and the constructor arguments
+        """
+        return (DID, (self.scope, self.name))
+
     def __ne__(self, other: Union[str, "DID"]) -> bool:
         """
         Inequality comparison with another object
         :return: bool
         """
-        return not self.__eq__(other)
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
 
     def __hash__(self) -> int:
         """
         Uses the string representation of self to create a hash
         :return: int
         """
-        return hash(str(self))
+        h = self._hash
+        if h is None:
+            h = hash(str(self))
+            object.__setattr__(self, '_hash', h)
+        return h
+
+
+# Dispatch table keyed on the exact input type. Looking up type(did) here is
+# cheaper than walking an isinstance() chain for the common cases; subclasses
+# are still handled by the isinstance() fallback in _construct_did.
+_CONSTRUCT_DISPATCH = {
+    dict: DID._did_from_dict,
+    tuple: DID._did_from_list_or_tuple,
+    list: DID._did_from_list_or_tuple,
+    str: DID._did_from_str,
+    DID: DID._did_from_did_object,
+}
+
+try:
+    # Prefer the optional Cython build of this class when the extension was
+    # compiled; installations without it keep the pure-Python implementation
+    # above.
+    from rucio.common._didtype import DID  # noqa: F811
+except ImportError:
+    pass
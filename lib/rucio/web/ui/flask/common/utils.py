@@ -15,13 +15,14 @@
 
 import html
 import re
+from functools import lru_cache
 from json import dumps, load
-from os.path import dirname, join
+from os.path import dirname, getmtime, join
 from time import time
 from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import quote, unquote
 
-from flask import Response, make_response, redirect, render_template, request
+from flask import Response, current_app, make_response, redirect, render_template, request
 
 from rucio.common.config import config_get, config_get_bool
 from rucio.common.constants import DEFAULT_VO
@@ -233,6 +234,45 @@ def validate_webui_token(from_cookie=True, session_token=None):
         raise CannotAuthenticate("No token found. Token must be either in cookies (with from_cookie=True) or provided separately.")
 
 
+@lru_cache(maxsize=None)
+def _template_path(template):
+    """
+    Resolves a template name to its source file path once per process.
+    :param template: the template name
+    :returns: path of the template file, or None for non-file templates
+    """
+    return current_app.jinja_env.get_or_select_template(template).filename
+
+
+@lru_cache(maxsize=64)
+def _render_cached(template, mtime, **context):
+    """
+    Renders and caches a template for the given context. The mtime of the
+    template file is part of the cache key, so editing the file invalidates
+    its entries.
+    :param template: the template name
+    :param mtime: modification time of the template file
+    :param context: template context, must be hashable
+    :returns: rendered template
+    """
+    return render_template(template, **context)
+
+
+def render_template_memoized(template, **context):
+    """
+    Renders a template whose output depends only on the given context,
+    reusing the cached result when the same page was already rendered.
+    :param template: the template name
+    :param context: template context, must be hashable
+    :returns: rendered template
+    """
+    try:
+        mtime = getmtime(_template_path(template))
+    except (OSError, TypeError):
+        return render_template(template, **context)
+    return _render_cached(template, mtime, **context)
+
+
 def access_granted(valid_token_dict, template, title):
     """
     Assuming validated token dictionary is provided, renders required template page.
@@ -241,7 +281,7 @@ def access_granted(valid_token_dict, template, title):
     :returns: rendered base temmplate with template content
     """
     policy = get_policy()
-    return render_template(template, token=valid_token_dict['token'], account=valid_token_dict['account'], vo=valid_token_dict['vo'], policy=policy, title=title)
+    return render_template_memoized(template, token=valid_token_dict['token'], account=valid_token_dict['account'], vo=valid_token_dict['vo'], policy=policy, title=title)
 
 
 def finalize_auth(token, identity_type, cookie_dict_extra=None):
@@ -607,7 +647,7 @@ def authenticate(template, title):
 
     # login without any known server config
     if not AUTH_TYPE:
-        return add_cookies(make_response(render_template("select_login_method.html", oidc_issuers=AUTH_ISSUERS, saml_support=SAML_SUPPORT, userpass_support=USERPASS_SUPPORT)), cookie)
+        return add_cookies(make_response(render_template_memoized("select_login_method.html", oidc_issuers=tuple(AUTH_ISSUERS), saml_support=SAML_SUPPORT, userpass_support=USERPASS_SUPPORT)), cookie)
     # for AUTH_TYPE predefined by the server continue
     else:
         if AUTH_TYPE == 'userpass':
@@ -41,6 +41,14 @@ data_files = [
 ]
 scripts = glob.glob('bin/rucio*')
 
+# The compiled DID accelerator is optional: it is only built when Cython is
+# available, and pure-Python installations work without it.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['lib/rucio/common/_didtype.pyx'], language_level=3)
+except ImportError:
+    ext_modules = []
+
 if os.path.exists('build/'):
     shutil.rmtree('build/')
 if os.path.exists('lib/rucio_clients.egg-info/'):
@@ -56,6 +64,7 @@ setup(
     data_files=data_files,
     include_package_data=True,
     scripts=scripts,
+    ext_modules=ext_modules,
     author="Rucio",
     author_email="rucio-dev@cern.ch",
     description=description,
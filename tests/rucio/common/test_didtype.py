@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+
 import pytest
 
 from rucio.common.didtype import DID
@@ -89,10 +91,23 @@ class TestDIDType:
         ]
     )
     def test_is_valid_format(self, scope, name, is_valid):
-        did = DID()
-        did.scope = scope
-        did.name = name
-        assert did.is_valid_format() == is_valid
+        if is_valid:
+            assert DID(scope=scope, name=name).is_valid_format()
+        else:
+            with pytest.raises(DIDError, match='Object has invalid format after construction'):
+                DID(scope=scope, name=name)
+
+    def test_immutable(self):
+        x = DID('test.scope:test.name')
+        with pytest.raises(AttributeError):
+            x.scope = 'other.scope'
+        with pytest.raises(AttributeError):
+            x.name = 'other.name'
+
+    def test_pickle(self):
+        x = DID('test.scope:test.name')
+        y = pickle.loads(pickle.dumps(x))
+        assert x == y
 
     def test_too_many_args(self):
         with pytest.raises(DIDError, match='Constructor takes at most 2 arguments. Given number: 3'):